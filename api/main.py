@@ -1,19 +1,54 @@
-from contextlib import asynccontextmanager
+import logging
+from contextlib import asynccontextmanager, contextmanager
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from queue import SimpleQueue
 
 from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
+from pydantic_core import to_json
 
+from src.config import settings
 from src.database.database import init_db
+from src.responses import FastJSONResponse
 from src.routers import auth, chats, statistics
+from src.services.ollama import close_ollama_client, get_ollama_client
+
+
+@contextmanager
+def queued_logging():
+    """
+    Send log records through a queue to a background thread that does the
+    actual stderr writes, so logging never blocks the event loop.
+    """
+    log_queue = SimpleQueue()
+    handler = QueueHandler(log_queue)
+    listener = QueueListener(log_queue, logging.StreamHandler(), respect_handler_level=True)
+    root_logger = logging.getLogger()
+    root_logger.addHandler(handler)
+    listener.start()
+    try:
+        yield
+    finally:
+        # Detach first so nothing is queued once the listener stops draining
+        root_logger.removeHandler(handler)
+        listener.stop()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    await init_db()
-    yield
+    with queued_logging():
+        # Schema creation normally runs out of band (python -m src.database.database)
+        if settings.run_migrations:
+            await init_db()
+        # Read the browser interface once; it only changes between deploys
+        html_file = Path("static/index.html")
+        app.state.index_html = html_file.read_bytes() if html_file.exists() else None
+        get_ollama_client()
+        yield
+        await close_ollama_client()
 
 
 app = FastAPI(
@@ -21,6 +56,7 @@ app = FastAPI(
     description="Authentication and chat management boilerplate for Llama 3.2 workshop",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 app.add_middleware(
@@ -44,63 +80,61 @@ if static_dir.exists():
     app.mount("/static", StaticFiles(directory="static"), name="static")
 
 
+_API_ENDPOINTS = {
+    "auth": {
+        "register": "/api/auth/register",
+        "login": "/api/auth/login",
+    },
+    "chats": {
+        "create": "/api/chats",
+        "list": "/api/chats",
+        "delete": "/api/chats/{chat_id}",
+        "messages": "/api/chats/{chat_id}/messages",
+    },
+    "statistics": {
+        "create": "/api/statistics",
+        "stream": "/api/statistics/stream",
+        "list": "/api/statistics",
+        "get": "/api/statistics/{request_id}",
+    },
+}
+
+# Constant payloads, serialized once at import
+_ROOT_INFO_JSON = to_json(
+    {
+        "message": "Welcome to Llama Chat API - Starter Kit!",
+        "docs": "/docs",
+        "web_interface": "Visit /static/index.html after creating the static directory",
+        "endpoints": _API_ENDPOINTS,
+    }
+)
+_API_INFO_JSON = to_json(
+    {
+        "message": "Welcome to Llama Chat API - Starter Kit!",
+        "docs": "/docs",
+        "web_interface": "/",
+        "endpoints": _API_ENDPOINTS,
+    }
+)
+
+
 @app.get("/")
 async def root():
     """Serve the HTML interface for browser access or API info"""
-    html_file = Path("static/index.html")
-    if html_file.exists():
-        return FileResponse(html_file)
+    if app.state.index_html is not None:
+        return HTMLResponse(
+            content=app.state.index_html,
+            headers={"Cache-Control": "public, max-age=300"},
+        )
     else:
         # Fallback to JSON response if HTML file doesn't exist
-        return {
-            "message": "Welcome to Llama Chat API - Starter Kit!",
-            "docs": "/docs",
-            "web_interface": "Visit /static/index.html after creating the static directory",
-            "endpoints": {
-                "auth": {
-                    "register": "/api/auth/register",
-                    "login": "/api/auth/login",
-                },
-                "chats": {
-                    "create": "/api/chats",
-                    "list": "/api/chats",
-                    "delete": "/api/chats/{chat_id}",
-                    "messages": "/api/chats/{chat_id}/messages",
-                },
-                "statistics": {
-                    "create": "/api/statistics",
-                    "list": "/api/statistics",
-                    "get": "/api/statistics/{request_id}",
-                },
-            },
-        }
+        return Response(content=_ROOT_INFO_JSON, media_type="application/json")
 
 
 @app.get("/api/info")
 async def api_info():
     """API information endpoint"""
-    return {
-        "message": "Welcome to Llama Chat API - Starter Kit!",
-        "docs": "/docs",
-        "web_interface": "/",
-        "endpoints": {
-            "auth": {
-                "register": "/api/auth/register",
-                "login": "/api/auth/login",
-            },
-            "chats": {
-                "create": "/api/chats",
-                "list": "/api/chats",
-                "delete": "/api/chats/{chat_id}",
-                "messages": "/api/chats/{chat_id}/messages",
-            },
-            "statistics": {
-                "create": "/api/statistics",
-                "list": "/api/statistics",
-                "get": "/api/statistics/{request_id}",
-            },
-        },
-    }
+    return Response(content=_API_INFO_JSON, media_type="application/json")
 
 
 @app.get("/reload-test")
@@ -109,6 +143,17 @@ async def reload_test():
 
 
 if __name__ == "__main__":
+    import os
+
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get("WEB_CONCURRENCY", max(2, os.cpu_count() or 1))),
+        log_level="warning",
+        access_log=False,
+    )
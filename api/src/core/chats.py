@@ -1,58 +1,77 @@
-from datetime import datetime, timezone
-from typing import Optional
-from uuid import uuid4
+from typing import AsyncIterator, Optional
+from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..database.ids import uuid7
 from ..database.models import Chat, Message
 
+async def create_chat(db: AsyncSession, user_id: int) -> Chat:
+    chat = Chat(id=uuid7(), user_id=user_id)
+    db.add(chat)
+    await db.commit()
+    return chat
 
-class ChatManager:
-    def __init__(self, db: AsyncSession):
-        self.db = db
-
-    async def create_chat(self, user_id: int) -> Chat:
-        chat = Chat(id=str(uuid4()), user_id=user_id)
-        self.db.add(chat)
-        await self.db.commit()
-        await self.db.refresh(chat)
-        return chat
-
-    async def get_chat(self, chat_id: str) -> Optional[Chat]:
-        result = await self.db.execute(select(Chat).where(Chat.id == chat_id))
-        return result.scalar_one_or_none()
-
-    async def get_user_chats(self, user_id: int) -> list[Chat]:
-        result = await self.db.execute(
-            select(Chat).where(Chat.user_id == user_id).order_by(Chat.updated_at.desc())
-        )
-        return list(result.scalars().all())
-
-    async def delete_chat(self, chat_id: str) -> bool:
-        chat = await self.get_chat(chat_id)
-        if chat:
-            await self.db.delete(chat)
-            await self.db.commit()
-            return True
-        return False
-
-    async def add_message(self, chat_id: str, role: str, content: str) -> Message:
-        message = Message(chat_id=chat_id, role=role, content=content)
-        self.db.add(message)
-
-        chat = await self.get_chat(chat_id)
-        if chat:
-            chat.updated_at = datetime.now(timezone.utc)
-
-        await self.db.commit()
-        await self.db.refresh(message)
-        return message
-
-    async def get_chat_messages(self, chat_id: str) -> list[Message]:
-        result = await self.db.execute(
-            select(Message)
-            .where(Message.chat_id == chat_id)
-            .order_by(Message.created_at)
-        )
-        return list(result.scalars().all())
+
+async def get_user_chats(db: AsyncSession, user_id: int) -> list[Row]:
+    result = await db.execute(
+        select(Chat.id, Chat.created_at, Chat.updated_at)
+        .where(Chat.user_id == user_id)
+        .order_by(Chat.updated_at.desc())
+    )
+    return list(result.all())
+
+
+async def delete_chat(db: AsyncSession, chat_id: UUID, user_id: int) -> bool:
+    result = await db.execute(
+        delete(Chat)
+        .where(Chat.id == chat_id, Chat.user_id == user_id)
+        .returning(Chat.id)
+    )
+    await db.commit()
+    return result.scalar_one_or_none() is not None
+
+
+async def add_message(
+    db: AsyncSession, chat_id: UUID, role: str, content: str
+) -> Message:
+    message = Message(chat_id=chat_id, role=role, content=content)
+    db.add(message)
+    await db.execute(
+        update(Chat).where(Chat.id == chat_id).values(updated_at=func.now())
+    )
+    await db.commit()
+    return message
+
+
+async def stream_messages_if_owned(
+    db: AsyncSession, chat_id: UUID, user_id: int, batch_size: int = 200
+) -> Optional[AsyncIterator[list[dict]]]:
+    """
+    Stream a chat's messages in batches, checking ownership in the same query.
+    Returns None if the chat doesn't exist or belongs to another user.
+    """
+    result = await db.stream(
+        select(Message.role, Message.content, Message.created_at)
+        .select_from(Chat)
+        .outerjoin(Message, Message.chat_id == Chat.id)
+        .where(Chat.id == chat_id, Chat.user_id == user_id)
+        .order_by(Message.created_at)
+        .execution_options(yield_per=batch_size)
+    )
+    batches = result.mappings().partitions()
+    first = await anext(batches, None)
+    if first is None:
+        await result.close()
+        return None
+
+    async def messages() -> AsyncIterator[list[dict]]:
+        # A chat without messages comes back as a single all-NULL row
+        if first[0]["role"] is None:
+            return
+        yield [dict(row) for row in first]
+        async for batch in batches:
+            yield [dict(row) for row in batch]
+
+    return messages()
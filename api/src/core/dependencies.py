@@ -1,32 +1,76 @@
-from datetime import datetime, timezone
-from typing import Annotated
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Annotated, Optional
+from uuid import UUID
 
 from fastapi import Depends, HTTPException
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from ..database.database import get_db
 from ..database.models import Session, User
 
 security = HTTPBearer()
 
+_GET_SESSION_USER = (
+    select(User, Session.expires_at)
+    .join(Session, Session.user_id == User.id)
+    .where(Session.id == bindparam("token"), Session.expires_at >= func.now())
+)
+
+# Short-lived in-process cache of authenticated sessions: token -> (user, valid_until)
+SESSION_CACHE_TTL = 5.0
+SESSION_CACHE_MAXSIZE = 10_000
+_session_cache: OrderedDict[UUID, tuple[User, float]] = OrderedDict()
+
+
+def _get_cached_user(token: UUID) -> Optional[User]:
+    entry = _session_cache.get(token)
+    if entry is None:
+        return None
+    user, valid_until = entry
+    if valid_until <= time.time():
+        del _session_cache[token]
+        return None
+    _session_cache.move_to_end(token)
+    return user
+
+
+def _cache_user(token: UUID, user: User, expires_at: datetime) -> None:
+    _session_cache[token] = (
+        user,
+        min(time.time() + SESSION_CACHE_TTL, expires_at.timestamp()),
+    )
+    _session_cache.move_to_end(token)
+    if len(_session_cache) > SESSION_CACHE_MAXSIZE:
+        _session_cache.popitem(last=False)
+
+
+def invalidate_cached_session(token: UUID) -> None:
+    _session_cache.pop(token, None)
+
 
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> User:
-    token = credentials.credentials
-    result = await db.execute(
-        select(Session).where(Session.id == token).options(selectinload(Session.user))
-    )
-    session = result.scalar_one_or_none()
+    try:
+        token = UUID(credentials.credentials)
+    except ValueError:
+        raise HTTPException(status_code=401, detail="Invalid or expired token")
+
+    user = _get_cached_user(token)
+    if user:
+        return user
 
-    if not session:
-        raise HTTPException(status_code=401, detail="Invalid token")
+    result = await db.execute(_GET_SESSION_USER, {"token": token})
+    row = result.one_or_none()
 
-    if session.expires_at < datetime.now(timezone.utc):
-        raise HTTPException(status_code=401, detail="Token expired")
+    if not row:
+        raise HTTPException(status_code=401, detail="Invalid or expired token")
 
-    return session.user
+    user, expires_at = row
+    _cache_user(token, user, expires_at)
+    return user
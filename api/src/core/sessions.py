@@ -1,52 +1,69 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
 from typing import Optional
-from uuid import uuid4
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database.models import Session, User
 from .auth import hash_password, verify_password
+from .dependencies import invalidate_cached_session
 
+async def create_user(db: AsyncSession, username: str, password: str) -> User:
+    password_hash = await asyncio.to_thread(hash_password, password)
+    user = User(username=username, password_hash=password_hash)
+    db.add(user)
+    await db.commit()
+    return user
 
-class SessionManager:
-    def __init__(self, db: AsyncSession):
-        self.db = db
 
-    async def create_user(self, username: str, password: str) -> User:
-        password_hash = hash_password(password)
-        user = User(username=username, password_hash=password_hash)
-        self.db.add(user)
-        await self.db.commit()
-        await self.db.refresh(user)
+async def create_user_with_session(
+    db: AsyncSession, username: str, password: str
+) -> tuple[User, Session]:
+    password_hash = await asyncio.to_thread(hash_password, password)
+    user = User(username=username, password_hash=password_hash)
+    db.add(user)
+    await db.flush()
+
+    session = Session(
+        id=uuid4(),
+        user_id=user.id,
+        expires_at=datetime.now(timezone.utc) + timedelta(hours=24),
+    )
+    db.add(session)
+    await db.commit()
+    return user, session
+
+
+async def authenticate_user(
+    db: AsyncSession, username: str, password: str
+) -> Optional[User]:
+    result = await db.execute(select(User).where(User.username == username))
+    user = result.scalar_one_or_none()
+    if user and await asyncio.to_thread(
+        verify_password, password, user.password_hash
+    ):
         return user
+    return None
+
+
+async def create_session(db: AsyncSession, user_id: int) -> Session:
+    session = Session(
+        id=uuid4(),
+        user_id=user_id,
+        expires_at=datetime.now(timezone.utc) + timedelta(hours=24),
+    )
+    db.add(session)
+    await db.commit()
+    return session
+
 
-    async def authenticate_user(self, username: str, password: str) -> Optional[User]:
-        result = await self.db.execute(select(User).where(User.username == username))
-        user = result.scalar_one_or_none()
-        if user and verify_password(password, user.password_hash):
-            return user
-        return None
-
-    async def create_session(self, user_id: int) -> Session:
-        session = Session(
-            id=str(uuid4()),
-            user_id=user_id,
-            expires_at=datetime.now(timezone.utc) + timedelta(hours=24),
-        )
-        self.db.add(session)
-        await self.db.commit()
-        await self.db.refresh(session)
-        return session
-
-    async def get_session(self, session_id: str) -> Optional[Session]:
-        result = await self.db.execute(select(Session).where(Session.id == session_id))
-        return result.scalar_one_or_none()
-
-    async def delete_session(self, session_id: str) -> bool:
-        session = await self.get_session(session_id)
-        if session:
-            await self.db.delete(session)
-            await self.db.commit()
-            return True
-        return False
+async def delete_session(db: AsyncSession, session_id: UUID) -> bool:
+    result = await db.execute(
+        delete(Session).where(Session.id == session_id).returning(Session.id)
+    )
+    await db.commit()
+    # Evict only once the row is gone, so a concurrent lookup can't re-cache it
+    invalidate_cached_session(session_id)
+    return result.scalar_one_or_none() is not None
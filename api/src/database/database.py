@@ -1,9 +1,24 @@
+import asyncio
+
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from ..config import settings
 from .models import Base
 
-engine = create_async_engine(settings.database_url, echo=False)
+_engine_options = dict(
+    echo=False,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    connect_args={
+        "statement_cache_size": settings.db_statement_cache_size,
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+    },
+)
+
+engine = create_async_engine(settings.database_url, **_engine_options)
 async_session_maker = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
@@ -14,6 +29,29 @@ async def get_db():
         yield session
 
 
+if settings.read_database_url:
+    read_engine = create_async_engine(
+        settings.read_database_url, **_engine_options
+    ).execution_options(postgresql_readonly=True)
+    read_session_maker = async_sessionmaker(
+        read_engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async def get_read_db():
+        async with read_session_maker() as session:
+            yield session
+
+else:
+    # Without a replica, read routes share the request's primary session
+    # (FastAPI caches get_db per request, so get_current_user uses the same
+    # one) instead of checking a second connection out of the same pool
+    get_read_db = get_db
+
+
 async def init_db():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+
+
+if __name__ == "__main__":
+    asyncio.run(init_db())
@@ -0,0 +1,23 @@
+import os
+import time
+from uuid import UUID
+
+
+def uuid7() -> UUID:
+    """Time-ordered UUID (RFC 9562, version 7).
+
+    48-bit millisecond Unix timestamp followed by random bits, so new keys
+    land on the right-hand side of B-tree indexes instead of random pages.
+    """
+    unix_ts_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    rand_a = (rand >> 62) & 0xFFF
+    rand_b = rand & ((1 << 62) - 1)
+    value = (
+        (unix_ts_ms & ((1 << 48) - 1)) << 80
+        | 0x7 << 76
+        | rand_a << 64
+        | 0b10 << 62
+        | rand_b
+    )
+    return UUID(int=value)
@@ -0,0 +1,11 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse encoded by pydantic-core's Rust serializer instead of json.dumps."""
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..core.sessions import SessionManager
+from ..core import sessions
 from ..database.database import get_db
 from ..schemas import LoginRequest, LoginResponse, RegisterRequest
 
@@ -16,10 +16,11 @@ async def register(
     request: RegisterRequest,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
-    manager = SessionManager(db)
     try:
-        user = await manager.create_user(request.username, request.password)
-        return {"user_id": user.id, "username": user.username}
+        user, session = await sessions.create_user_with_session(
+            db, request.username, request.password
+        )
+        return {"user_id": user.id, "username": user.username, "session_id": session.id}
     except IntegrityError:
         raise HTTPException(status_code=400, detail="Username already exists")
 
@@ -29,11 +30,10 @@ async def login(
     request: LoginRequest,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
-    manager = SessionManager(db)
-    user = await manager.authenticate_user(request.username, request.password)
+    user = await sessions.authenticate_user(db, request.username, request.password)
 
     if not user:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    session = await manager.create_session(user.id)
+    session = await sessions.create_session(db, user.id)
     return LoginResponse(session_id=session.id, user_id=user.id, username=user.username)
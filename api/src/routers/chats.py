@@ -1,28 +1,42 @@
-from typing import Annotated
+from typing import Annotated, AsyncIterator
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..core.chats import ChatManager
+from ..core import chats
 from ..core.dependencies import get_current_user
-from ..database.database import get_db
+from ..database.database import get_db, get_read_db
 from ..database.models import User
 from ..schemas import ChatSessionResponse, MessageResponse
 
 router = APIRouter(tags=["chats"])
 
 
+async def _encode_json_array(batches: AsyncIterator[list[dict]]) -> AsyncIterator[bytes]:
+    """Encode batches of rows as one JSON array, one chunk per batch."""
+    separator = b"["
+    async for batch in batches:
+        if batch:
+            yield separator + to_json(batch)[1:-1]
+            separator = b","
+    yield b"[]" if separator == b"[" else b"]"
+
+
 @router.get("/chats", response_model=list[ChatSessionResponse])
 async def list_chats(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
 ):
-    manager = ChatManager(db)
-    chats = await manager.get_user_chats(current_user.id)
-    return [
-        ChatSessionResponse(id=c.id, created_at=c.created_at, updated_at=c.updated_at)
-        for c in chats
-    ]
+    user_chats = await chats.get_user_chats(db, current_user.id)
+    # Rows already match ChatSessionResponse; encode them directly instead of
+    # building and re-validating a model per chat
+    return Response(
+        content=to_json([c._asdict() for c in user_chats]),
+        media_type="application/json",
+    )
 
 
 @router.post("/chats", response_model=ChatSessionResponse, status_code=201)
@@ -30,8 +44,7 @@ async def create_chat(
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
-    manager = ChatManager(db)
-    chat = await manager.create_chat(current_user.id)
+    chat = await chats.create_chat(db, current_user.id)
     return ChatSessionResponse(
         id=chat.id, created_at=chat.created_at, updated_at=chat.updated_at
     )
@@ -39,33 +52,27 @@ async def create_chat(
 
 @router.delete("/chats/{chat_id}", status_code=204)
 async def delete_chat(
-    chat_id: str,
+    chat_id: UUID,
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
-    manager = ChatManager(db)
-    chat = await manager.get_chat(chat_id)
-
-    if not chat or chat.user_id != current_user.id:
+    if not await chats.delete_chat(db, chat_id, current_user.id):
         raise HTTPException(status_code=404, detail="Chat not found")
 
-    await manager.delete_chat(chat_id)
-
 
 @router.get("/chats/{chat_id}/messages", response_model=list[MessageResponse])
 async def get_chat_messages(
-    chat_id: str,
+    chat_id: UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
 ):
-    manager = ChatManager(db)
-    chat = await manager.get_chat(chat_id)
+    # Ownership check and first batch of messages in one round trip
+    messages = await chats.stream_messages_if_owned(db, chat_id, current_user.id)
 
-    if not chat or chat.user_id != current_user.id:
+    if messages is None:
         raise HTTPException(status_code=404, detail="Chat not found")
 
-    messages = await manager.get_chat_messages(chat_id)
-    return [
-        MessageResponse(role=m.role, content=m.content, created_at=m.created_at)
-        for m in messages
-    ]
+    return StreamingResponse(
+        _encode_json_array(messages),
+        media_type="application/json",
+    )
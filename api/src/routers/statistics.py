@@ -1,20 +1,28 @@
+import logging
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.background import BackgroundTask
 
 from ..core.dependencies import get_current_user
-from ..core.statistics import StatisticsManager
-from ..database.database import get_db
+from ..core import statistics
+from ..database.database import async_session_maker, get_db, get_read_db
 from ..database.models import User
 from ..schemas import StatisticsQueryRequest, StatisticsResponse
 from ..services.statistics_service import StatisticsService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(tags=["statistics"])
 
 # Initialize statistics service (singleton)
 statistics_service = StatisticsService()
 
+_STATISTICS_LIST_ADAPTER = TypeAdapter(list[StatisticsResponse])
+
 
 @router.post("/statistics", response_model=StatisticsResponse, status_code=201)
 async def create_statistics_request(
@@ -33,63 +41,83 @@ async def create_statistics_request(
         )
         
         # Save to database
-        manager = StatisticsManager(db)
-        stats_request = await manager.create_statistics_request(
+        stats_request = await statistics.create_statistics_request(
+            db,
             user_id=current_user.id,
             request_info=request.query,
             response=ai_response["response"],
             source=ai_response["source"],
         )
         
-        return StatisticsResponse(
-            id=stats_request.id,
-            request_info=stats_request.request_info,
-            response=stats_request.response,
-            source=stats_request.source,
-            created_at=stats_request.created_at,
-        )
+        return StatisticsResponse.model_validate(stats_request)
     except Exception as e:
+        logger.exception("Failed to create statistics request")
         raise HTTPException(status_code=500, detail=f"Error generating statistics: {str(e)}")
 
 
+@router.post("/statistics/stream", status_code=201)
+async def stream_statistics_request(
+    request: StatisticsQueryRequest,
+    current_user: Annotated[User, Depends(get_current_user)],
+):
+    """
+    Create a statistics request, streaming the AI response as plain text while it is generated.
+    The complete response is saved once the stream has been sent.
+    """
+    chunks: list[str] = []
+
+    async def stream():
+        async for chunk in statistics_service.generate_statistics_stream(request.query):
+            chunks.append(chunk)
+            yield chunk
+
+    async def save():
+        if not chunks:
+            return
+        async with async_session_maker() as db:
+            await statistics.create_statistics_request(
+                db,
+                user_id=current_user.id,
+                request_info=request.query,
+                response="".join(chunks),
+                source=request.source,
+            )
+
+    return StreamingResponse(
+        stream(),
+        status_code=201,
+        media_type="text/plain; charset=utf-8",
+        background=BackgroundTask(save),
+    )
+
+
 @router.get("/statistics", response_model=list[StatisticsResponse])
 async def list_statistics_requests(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
 ):
     """Get all statistics requests for the current user."""
-    manager = StatisticsManager(db)
-    requests = await manager.get_user_statistics_requests(current_user.id)
-    return [
-        StatisticsResponse(
-            id=r.id,
-            request_info=r.request_info,
-            response=r.response,
-            source=r.source,
-            created_at=r.created_at,
-        )
-        for r in requests
-    ]
+    requests = await statistics.get_user_statistics_requests(db, current_user.id)
+    # Validate and serialize the whole list in pydantic-core in one pass each
+    return Response(
+        content=_STATISTICS_LIST_ADAPTER.dump_json(
+            _STATISTICS_LIST_ADAPTER.validate_python(requests, from_attributes=True)
+        ),
+        media_type="application/json",
+    )
 
 
 @router.get("/statistics/{request_id}", response_model=StatisticsResponse)
 async def get_statistics_request(
     request_id: int,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
 ):
     """Get a specific statistics request by ID."""
-    manager = StatisticsManager(db)
-    stats_request = await manager.get_statistics_request(request_id)
+    stats_request = await statistics.get_statistics_request(db, request_id)
     
     if not stats_request or stats_request.user_id != current_user.id:
         raise HTTPException(status_code=404, detail="Statistics request not found")
     
-    return StatisticsResponse(
-        id=stats_request.id,
-        request_info=stats_request.request_info,
-        response=stats_request.response,
-        source=stats_request.source,
-        created_at=stats_request.created_at,
-    )
+    return StatisticsResponse.model_validate(stats_request)
 
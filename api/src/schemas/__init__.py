@@ -1,6 +1,7 @@
 from datetime import datetime
+from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 class ChatRequest(BaseModel):
     message: str
@@ -23,19 +24,19 @@ class LoginRequest(BaseModel):
 
 
 class LoginResponse(BaseModel):
-    session_id: str
+    session_id: UUID
     user_id: int
     username: str
 
 
 class SessionResponse(BaseModel):
-    id: str
+    id: UUID
     created_at: datetime
     updated_at: datetime
 
 
 class ChatSessionResponse(BaseModel):
-    id: str
+    id: UUID
     created_at: datetime
     updated_at: datetime
 
@@ -52,6 +53,8 @@ class StatisticsQueryRequest(BaseModel):
 
 
 class StatisticsResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     request_info: str
     response: str
@@ -0,0 +1,26 @@
+from typing import Optional
+
+import httpx
+
+from ..config import settings
+
+# Shared client so requests to Ollama reuse pooled keep-alive connections
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_ollama_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=settings.ollama_host,
+            timeout=120.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+    return _client
+
+
+async def close_ollama_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -1,23 +1,22 @@
-import httpx
+import logging
+import time
+from collections import OrderedDict
 from datetime import datetime
+from typing import AsyncIterator, Optional
 
-from ..config import settings
+import httpx
+from pydantic_core import from_json, to_json
 
+from ..config import settings
+from .ollama import get_ollama_client
 
-class StatisticsService:
-    def __init__(self):
-        self.ollama_host = settings.ollama_host
-        self.model_name = settings.model_name
+logger = logging.getLogger(__name__)
 
-    async def generate_statistics(self, query: str, source: str = "AI Generated") -> dict:
-        """
-        Generate statistics response using Ollama AI model.
-        Returns a dictionary with response, source, and date.
-        The response will be in the same language as the query.
-        """
-        # Create a prompt that instructs the AI to provide statistics with date and source
-        # IMPORTANT: Respond in the same language as the user's question
-        system_prompt = """You are a helpful statistics assistant. When users ask for statistics, provide clear, well-formatted responses.
+# Create a prompt that instructs the AI to provide statistics with date and source
+# IMPORTANT: Respond in the same language as the user's question
+# Keep this free of per-request values (date, source, query) so it stays
+# byte-identical and Ollama's prompt-prefix cache can hit
+_SYSTEM_PROMPT = """You are a helpful statistics assistant. When users ask for statistics, provide clear, well-formatted responses.
 
 CRITICAL: Always respond in the SAME LANGUAGE as the user's question. If the question is in Spanish, respond in Spanish. If it's in French, respond in French. If it's in English, respond in English. Detect the language from the user's query and match it exactly.
 
@@ -37,11 +36,11 @@ RESPONSE STRUCTURE:
 5. Provide a brief explanation or context
 
 Make the response easy to scan and read. Use clear formatting with proper spacing."""
-        
-        user_prompt = f"""Please provide statistics for the following query: {query}
 
-IMPORTANT: 
-- Respond in the EXACT SAME LANGUAGE as the query above
+# Static instructions come before the query so every request shares the same
+# token prefix and Ollama can reuse its KV cache for it
+_USER_PROMPT_TEMPLATE = """IMPORTANT: 
+- Respond in the EXACT SAME LANGUAGE as the query below
 - Format your response with clear sections, bullet points, and proper spacing
 - Make it easy to read and scan
 - Use headings, lists, and line breaks for better readability
@@ -53,47 +52,185 @@ Structure your response as follows:
 4. Source information
 5. Brief explanation/context
 
-Format with proper spacing and structure for maximum readability."""
-        
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            try:
-                # Use Ollama's chat API for better compatibility
-                response = await client.post(
-                    f"{self.ollama_host}/api/chat",
-                    json={
-                        "model": self.model_name,
-                        "messages": [
-                            {"role": "system", "content": system_prompt},
-                            {"role": "user", "content": user_prompt},
-                        ],
-                        "stream": False,
-                    },
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                # Extract the response text from the message
-                ai_response = data.get("message", {}).get("content", "Unable to generate statistics at this time.")
-                if not ai_response:
-                    # Fallback: try old format for compatibility
-                    ai_response = data.get("response", "Unable to generate statistics at this time.")
-                
-                # Get current date for metadata
-                current_date = datetime.now().strftime("%Y-%m-%d")
-                
-                return {
-                    "response": ai_response,
-                    "source": source,
-                    "date": current_date,
+Format with proper spacing and structure for maximum readability.
+
+Please provide statistics for the following query: {query}"""
+
+_SYSTEM_MESSAGE = {"role": "system", "content": _SYSTEM_PROMPT}
+
+_today_cache: tuple[float, str] = (0.0, "")
+
+
+def _today() -> str:
+    """Today's date as YYYY-MM-DD, reformatted at most once a minute."""
+    global _today_cache
+    now = time.time()
+    if now - _today_cache[0] > 60:
+        _today_cache = (now, datetime.now().strftime("%Y-%m-%d"))
+    return _today_cache[1]
+
+
+class QueryCache:
+    """
+    Bounded TTL cache of AI responses keyed on a normalized query.
+    Only case and whitespace are normalized; word order matters, since
+    "US exports to China" and "China exports to US" ask different things.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    @staticmethod
+    def _key(query: str) -> str:
+        return " ".join(query.lower().split())
+
+    def get(self, query: str) -> Optional[str]:
+        key = self._key(query)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, response = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def set(self, query: str, response: str) -> None:
+        key = self._key(query)
+        self._entries[key] = (time.monotonic(), response)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+class StatisticsService:
+    def __init__(self):
+        self.model_name = settings.model_name
+        self.cache = QueryCache()
+        # Everything but the user prompt is constant, so encode it once per
+        # stream mode and only encode the prompt on each request
+        self._chat_body_heads = {
+            stream: to_json(
+                {
                     "model": self.model_name,
+                    "stream": stream,
+                    # Keep the model loaded between requests instead of paying a cold load
+                    "keep_alive": settings.ollama_keep_alive,
                 }
-            except httpx.HTTPError as e:
-                # Fallback response if Ollama is unavailable
-                current_date = datetime.now().strftime("%Y-%m-%d")
-                return {
-                    "response": f"I apologize, but I'm unable to generate statistics at this time. Please try again later. Error: {str(e)}",
-                    "source": source,
-                    "date": current_date,
-                    "model": "error",
-                }
+            )[:-1]
+            + b',"messages":['
+            + to_json(_SYSTEM_MESSAGE)
+            + b',{"role":"user","content":'
+            for stream in (False, True)
+        }
+
+    def _chat_body(self, user_prompt: str, stream: bool) -> bytes:
+        """Encode an Ollama /api/chat request body for the statistics prompt."""
+        return self._chat_body_heads[stream] + to_json(user_prompt) + b"}]}"
+
+    async def generate_statistics(self, query: str, source: str = "AI Generated") -> dict:
+        """
+        Generate statistics response using Ollama AI model.
+        Returns a dictionary with response, source, and date.
+        The response will be in the same language as the query.
+        """
+        # Reuse a recent answer to the same question instead of another LLM call
+        cached_response = self.cache.get(query)
+        if cached_response is not None:
+            return {
+                "response": cached_response,
+                "source": source,
+                "date": _today(),
+                "model": self.model_name,
+            }
+
+        user_prompt = _USER_PROMPT_TEMPLATE.format(query=query)
+
+        client = get_ollama_client()
+        try:
+            # Use Ollama's chat API for better compatibility
+            response = await client.post(
+                "/api/chat",
+                content=self._chat_body(user_prompt, stream=False),
+                headers={"Content-Type": "application/json"},
+            )
+            response.raise_for_status()
+            data = response.json()
+            
+            # Extract the response text from the message
+            # (falling back to the old format for compatibility)
+            content = data.get("message", {}).get("content") or data.get("response")
+            if content:
+                # Only cache real answers, never the placeholder below
+                self.cache.set(query, content)
+            ai_response = content or "Unable to generate statistics at this time."
+
+            return {
+                "response": ai_response,
+                "source": source,
+                "date": _today(),
+                "model": self.model_name,
+            }
+        except httpx.HTTPError as e:
+            logger.warning("Ollama chat request failed: %s", e)
+            # Fallback response if Ollama is unavailable
+            return {
+                "response": f"I apologize, but I'm unable to generate statistics at this time. Please try again later. Error: {str(e)}",
+                "source": source,
+                "date": _today(),
+                "model": "error",
+            }
+
+    async def generate_statistics_stream(self, query: str) -> AsyncIterator[str]:
+        """
+        Stream the statistics response from Ollama as text chunks.
+        Uses the same prompts as generate_statistics; the full response is
+        added to the query cache once the stream completes.
+        """
+        cached_response = self.cache.get(query)
+        if cached_response is not None:
+            yield cached_response
+            return
+
+        user_prompt = _USER_PROMPT_TEMPLATE.format(query=query)
+
+        client = get_ollama_client()
+        chunks: list[str] = []
+        try:
+            async with client.stream(
+                "POST",
+                "/api/chat",
+                content=self._chat_body(user_prompt, stream=True),
+                headers={"Content-Type": "application/json"},
+            ) as response:
+                response.raise_for_status()
+                # Split the NDJSON stream on raw bytes and parse each line
+                # directly, skipping httpx's text decoding and line splitting
+                buffer = bytearray()
+                done = False
+                async for data in response.aiter_bytes():
+                    buffer += data
+                    while not done and (newline := buffer.find(b"\n")) != -1:
+                        line = bytes(buffer[:newline])
+                        del buffer[: newline + 1]
+                        if not line.strip():
+                            continue
+                        message = from_json(line)
+                        content = message.get("message", {}).get("content")
+                        if content:
+                            chunks.append(content)
+                            yield content
+                        done = message.get("done", False)
+                    if done:
+                        break
+        except httpx.HTTPError as e:
+            logger.warning("Ollama chat stream failed: %s", e)
+            # Fallback text if Ollama is unavailable or the stream breaks
+            yield f"I apologize, but I'm unable to generate statistics at this time. Please try again later. Error: {str(e)}"
+            return
 
+        if chunks:
+            self.cache.set(query, "".join(chunks))